@@ -6,15 +6,30 @@ Usage:
     python analyze_ticket.py --summary "Ticket summary" --description "Ticket description"
     python analyze_ticket.py --summary "..." --description "..." --comments "Comment text"
     python analyze_ticket.py --json  # Output as JSON
+    python analyze_ticket.py --batch < tickets.ndjson  # One JSON result per input line
+
+In --batch mode each stdin line is a JSON object with "summary" and optional
+"description" and "comments" keys; results are written as NDJSON in input order.
+Lines that aren't JSON objects produce an {"error": ..., "line": n} result.
 """
 
-import argparse
 import json
 import sys
 import os
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    import argparse
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from utils.jira_patterns import classify_ticket_type, extract_urls, assess_ralph_eligibility
+from utils.jira_patterns import build_full_text, classify_ticket_type_from_text, assess_ralph_eligibility
 from utils.code_mapper import map_keywords_to_files, extract_index_from_urls, extract_index_from_text, get_primary_files
 
 
@@ -26,42 +41,120 @@ def analyze_ticket(summary: str, description: str, comments: str = "") -> dict:
         description: Ticket description
         comments: Formatted comments string (optional)
     """
-    full_text = f"{summary}\n{description}"
-    if comments:
-        full_text = f"{full_text}\n{comments}"
-
-    classification = classify_ticket_type(summary, description, comments)
+    full_text = build_full_text(summary, description, comments)
+    text_lower = full_text.lower()
+    classification = classify_ticket_type_from_text(full_text, text_lower)
 
     if classification["type"] == "CODE_CHANGE":
-        classification["suggested_files"] = get_primary_files(full_text)
-        classification["file_mappings"] = map_keywords_to_files(full_text)[:5]
+        mappings = map_keywords_to_files(full_text, text_lower)
+        classification["suggested_files"] = get_primary_files(full_text, mappings)
+        classification["file_mappings"] = mappings[:5]
 
         ticket_data = {"summary": summary, "description": description, "comments": comments}
-        ralph_assessment = assess_ralph_eligibility(ticket_data, classification)
+        ralph_assessment = assess_ralph_eligibility(ticket_data, classification, text_lower)
         classification["ralph_eligibility"] = ralph_assessment
 
     elif classification["type"] == "INVESTIGATION":
-        urls = extract_urls(full_text)
+        urls = classification["extracted_data"]["urls"]
         indices_from_urls = extract_index_from_urls(urls)
-        indices_from_text = extract_index_from_text(full_text)
-        all_indices = list(set(indices_from_urls + indices_from_text))
-        classification["suggested_indices"] = all_indices if all_indices else []
+        indices_from_text = extract_index_from_text(full_text, text_lower)
+        classification["suggested_indices"] = list(dict.fromkeys(indices_from_urls + indices_from_text))
 
     return classification
 
 
-def main():
+def to_json(result: dict, pretty: bool = False) -> str:
+    """Serialize a result to JSON, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2 if pretty else 0).decode()
+    return json.dumps(result, indent=2 if pretty else None)
+
+
+def analyze_tickets_batch(lines: Iterable[str]) -> Iterator[dict]:
+    """Analyze tickets given as NDJSON lines, yielding one result per ticket.
+
+    A line that isn't a JSON object yields {"error": ..., "line": n} in its
+    place, so one bad line doesn't lose the rest of the batch. Missing or
+    null fields are treated as empty.
+    """
+    loads = orjson.loads if HAS_ORJSON else json.loads
+    for line_number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            ticket = loads(line)
+        except ValueError as e:
+            yield {"error": f"Invalid JSON: {e}", "line": line_number}
+            continue
+        if not isinstance(ticket, dict):
+            yield {"error": "Expected a JSON object", "line": line_number}
+            continue
+        yield analyze_ticket(*(
+            "" if ticket.get(field) is None else ticket[field]
+            for field in ("summary", "description", "comments")
+        ))
+
+
+_VALUE_FLAGS = ("--summary", "--description", "--comments")
+_SWITCH_FLAGS = ("--json", "--batch")
+
+
+def _parse_args_fast(argv: List[str]) -> Optional[SimpleNamespace]:
+    """Parse the plain flag/value invocation used by automation.
+
+    Returns None for anything else (--help, --flag=value, abbreviations,
+    missing or dash-prefixed values, or an absent --summary) so argparse
+    can handle it.
+    """
+    args = {"summary": None, "description": "", "comments": "", "json": False, "batch": False}
+    it = iter(argv)
+    for arg in it:
+        if arg in _SWITCH_FLAGS:
+            args[arg[2:]] = True
+        elif arg in _VALUE_FLAGS:
+            value = next(it, None)
+            # argparse treats a following option as a missing value
+            if value is None or value.startswith("-"):
+                return None
+            args[arg[2:]] = value
+        else:
+            return None
+
+    if args["summary"] is None and not args["batch"]:
+        return None
+    return SimpleNamespace(**args)
+
+
+def _parse_args(argv: List[str]) -> "argparse.Namespace":
+    """Parse arguments with argparse, for help and error reporting."""
+    import argparse
+
     parser = argparse.ArgumentParser(description="Analyze Jira ticket for classification")
-    parser.add_argument("--summary", required=True, help="Ticket summary/title")
+    parser.add_argument("--summary", help="Ticket summary/title (required unless --batch)")
     parser.add_argument("--description", default="", help="Ticket description")
     parser.add_argument("--comments", default="", help="Formatted comments from ticket")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
-    args = parser.parse_args()
+    parser.add_argument("--batch", action="store_true", help="Read NDJSON tickets from stdin, write NDJSON results")
+    args = parser.parse_args(argv)
+
+    if args.summary is None and not args.batch:
+        parser.error("--summary is required unless --batch is given")
+    return args
+
+
+def main():
+    argv = sys.argv[1:]
+    args = _parse_args_fast(argv) or _parse_args(argv)
+
+    if args.batch:
+        for result in analyze_tickets_batch(sys.stdin):
+            sys.stdout.write(to_json(result) + "\n")
+        return
 
     result = analyze_ticket(args.summary, args.description, args.comments)
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        print(to_json(result, pretty=True))
     else:
         print(f"Type: {result['type']}")
         print(f"Confidence: {result['confidence']:.2f}")
@@ -1,8 +1,21 @@
 """Parse Atlassian Document Format (ADF) to plain text."""
 
 import json
+import sys
+from collections import OrderedDict, namedtuple
 from typing import Union
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+ParsedComment = namedtuple("ParsedComment", "author text created")
+
+_COMMENT_TEXT_CACHE: "OrderedDict[tuple, str]" = OrderedDict()
+_COMMENT_TEXT_CACHE_SIZE = 512
+
 
 def parse_adf_to_text(adf: Union[dict, str]) -> str:
     """Convert ADF document to plain text.
@@ -15,7 +28,7 @@ def parse_adf_to_text(adf: Union[dict, str]) -> str:
     """
     if isinstance(adf, str):
         try:
-            adf = json.loads(adf)
+            adf = _json_loads(adf)
         except json.JSONDecodeError:
             return adf
 
@@ -25,50 +38,84 @@ def parse_adf_to_text(adf: Union[dict, str]) -> str:
     return _extract_text_from_node(adf).strip()
 
 
-def _extract_text_from_node(node: dict) -> str:
-    """Recursively extract text from an ADF node."""
-    if not isinstance(node, dict):
-        return ""
+_BLOCK_NODE_TYPES = frozenset(
+    ("paragraph", "heading", "blockquote", "listItem", "bulletList", "orderedList")
+)
+
+
+def _extract_text_from_node(root: dict) -> str:
+    """Extract text from an ADF node tree.
+
+    Walks the tree depth-first with an explicit stack, so deeply nested
+    documents cannot hit the recursion limit. A "\n" string pushed below a
+    block node's children emits the block's trailing newline once they
+    have been written.
+    """
+    buf = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            buf.append(node)
+            continue
+        if not isinstance(node, dict):
+            continue
+
+        node_type = node.get("type", "")
+
+        if node_type == "text":
+            buf.append(node.get("text", ""))
+            continue
+
+        if node_type == "mention":
+            buf.append(node.get("attrs", {}).get("text", ""))
+            continue
 
-    node_type = node.get("type", "")
-    text_parts = []
+        if node_type == "emoji":
+            buf.append(node.get("attrs", {}).get("shortName", ""))
+            continue
 
-    if node_type == "text":
-        return node.get("text", "")
+        if node_type == "hardBreak":
+            buf.append("\n")
+            continue
 
-    if node_type == "mention":
-        attrs = node.get("attrs", {})
-        return attrs.get("text", "")
+        if node_type in _BLOCK_NODE_TYPES:
+            stack.append("\n")
 
-    if node_type == "emoji":
-        attrs = node.get("attrs", {})
-        return attrs.get("shortName", "")
+        children = node.get("content") or ()
+        stack.extend(child for child in reversed(children) if isinstance(child, dict))
 
-    if node_type == "hardBreak":
-        return "\n"
+    return "".join(buf)
 
-    content = node.get("content", [])
-    for child in content:
-        text_parts.append(_extract_text_from_node(child))
 
-    result = "".join(text_parts)
+def _comment_text(comment: dict) -> str:
+    """Convert a comment body to text, caching by comment id and update time."""
+    body = comment.get("body", {})
+    comment_id = comment.get("id")
+    if not comment_id:
+        return parse_adf_to_text(body)
 
-    if node_type in ("paragraph", "heading", "blockquote", "listItem"):
-        result = result + "\n"
-    elif node_type in ("bulletList", "orderedList"):
-        result = result + "\n"
+    key = (comment_id, comment.get("updated") or comment.get("created", ""))
+    text = _COMMENT_TEXT_CACHE.get(key)
+    if text is not None:
+        _COMMENT_TEXT_CACHE.move_to_end(key)
+        return text
 
-    return result
+    text = parse_adf_to_text(body)
+    _COMMENT_TEXT_CACHE[key] = text
+    if len(_COMMENT_TEXT_CACHE) > _COMMENT_TEXT_CACHE_SIZE:
+        _COMMENT_TEXT_CACHE.popitem(last=False)
+    return text
 
 
-def parse_jira_comments(comments_data: Union[list, dict]) -> list[dict]:
+def parse_jira_comments(comments_data: Union[list, dict]) -> list[ParsedComment]:
     """Parse Jira comments array into simplified format.
 
     Args:
         comments_data: Raw comments from Jira API (fields.comment.comments)
 
     Returns:
-        List of dicts with 'author', 'text', 'created' keys
+        List of ParsedComment tuples with 'author', 'text', 'created' fields
     """
     if isinstance(comments_data, dict):
         comments_data = comments_data.get("comments", [])
@@ -79,20 +126,17 @@ def parse_jira_comments(comments_data: Union[list, dict]) -> list[dict]:
     parsed = []
     for comment in comments_data:
         author = comment.get("author", {}).get("displayName", "Unknown")
-        body = comment.get("body", {})
-        text = parse_adf_to_text(body)
+        if isinstance(author, str):
+            author = sys.intern(author)
+        text = _comment_text(comment)
         created = comment.get("created", "")
 
-        parsed.append({
-            "author": author,
-            "text": text,
-            "created": created
-        })
+        parsed.append(ParsedComment(author, text, created))
 
     return parsed
 
 
-def format_comments_for_analysis(comments: list[dict]) -> str:
+def format_comments_for_analysis(comments: list[ParsedComment]) -> str:
     """Format parsed comments into a single string for analysis.
 
     Args:
@@ -106,9 +150,8 @@ def format_comments_for_analysis(comments: list[dict]) -> str:
 
     lines = []
     for i, comment in enumerate(comments, 1):
-        author = comment.get("author", "Unknown")
-        text = comment.get("text", "").strip()
+        text = comment.text.strip()
         if text:
-            lines.append(f"[Comment {i} by {author}]: {text}")
+            lines.append(f"[Comment {i} by {comment.author}]: {text}")
 
     return "\n".join(lines)
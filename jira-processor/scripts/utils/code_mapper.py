@@ -1,6 +1,6 @@
 """Map ticket requirements to relevant code files."""
 
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from .config_loader import get_code_mapping, get_index_url_mapping
 
 DEFAULT_CODE_MAPPING_RULES = [
@@ -26,27 +26,66 @@ def get_index_url_map() -> Dict:
     return get_index_url_mapping()
 
 
-INDEX_URL_MAPPING = property(lambda self: get_index_url_map())
+_rules_cache: Tuple = (None, ())
+_index_terms_cache: Tuple = (None, ())
 
 
-def map_keywords_to_files(text: str) -> List[Dict]:
+def _compiled_rules() -> Tuple[Tuple[str, ...], Tuple[Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]], ...]]:
+    """Return the distinct lowercased keywords across all rules, plus
+    (keywords, lowercased keywords, files) per rule.
+
+    Rebuilt only when the rules object changes, i.e. when the repo config
+    is reloaded.
+    """
+    global _rules_cache
+    rules = get_code_mapping_rules()
+    if _rules_cache[0] is not rules:
+        compiled = tuple(
+            (tuple(rule["keywords"]), tuple(kw.lower() for kw in rule["keywords"]), tuple(rule["files"]))
+            for rule in rules
+        )
+        terms = tuple(dict.fromkeys(kw_lower for _, keywords_lower, _ in compiled for kw_lower in keywords_lower))
+        _rules_cache = (rules, (terms, compiled))
+    return _rules_cache[1]
+
+
+def _index_terms() -> Tuple[Tuple[str, str, str], ...]:
+    """Return (lowercased domain, lowercased index name, index name) per mapping entry."""
+    global _index_terms_cache
+    mapping = get_index_url_map()
+    if _index_terms_cache[0] is not mapping:
+        terms = tuple(
+            (domain.lower(), index_name.lower(), index_name)
+            for domain, index_name in mapping.items()
+        )
+        _index_terms_cache = (mapping, terms)
+    return _index_terms_cache[1]
+
+
+def map_keywords_to_files(text: str, text_lower: Optional[str] = None) -> List[Dict]:
     """
     Map text content to relevant code files.
 
+    Pass text_lower when the caller already has text.lower().
+
     Returns list of dicts with:
         - file: file path
         - keywords_matched: list of keywords that matched
         - confidence: float (0.0 to 1.0)
     """
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
     results = []
-    rules = get_code_mapping_rules()
+    terms, rules = _compiled_rules()
+    hits = {term for term in terms if term in text_lower}
+    if not hits:
+        return results
 
-    for rule in rules:
-        matched_keywords = [kw for kw in rule["keywords"] if kw.lower() in text_lower]
+    for keywords, keywords_lower, files in rules:
+        matched_keywords = [kw for kw, kw_lower in zip(keywords, keywords_lower) if kw_lower in hits]
         if matched_keywords:
-            confidence = min(len(matched_keywords) / len(rule["keywords"]), 1.0)
-            for file_path in rule["files"]:
+            confidence = min(len(matched_keywords) / len(keywords), 1.0)
+            for file_path in files:
                 results.append({
                     "file": file_path,
                     "keywords_matched": matched_keywords,
@@ -59,29 +98,35 @@ def map_keywords_to_files(text: str) -> List[Dict]:
 
 def extract_index_from_urls(urls: List[str]) -> List[str]:
     """Extract Algolia index names from URLs based on repo config."""
-    indices = set()
-    mapping = get_index_url_map()
+    indices = {}
+    terms = _index_terms()
     for url in urls:
         url_lower = url.lower()
-        for domain, index_name in mapping.items():
-            if domain in url_lower:
-                indices.add(index_name)
+        for domain_lower, _, index_name in terms:
+            if domain_lower in url_lower:
+                indices.setdefault(index_name, None)
     return list(indices)
 
 
-def extract_index_from_text(text: str) -> List[str]:
+def extract_index_from_text(text: str, text_lower: Optional[str] = None) -> List[str]:
     """Extract index names mentioned directly in text."""
-    indices = []
-    mapping = get_index_url_map()
-    for domain, index_name in mapping.items():
-        if index_name.lower() in text.lower() or domain.lower() in text.lower():
-            indices.append(index_name)
-    return list(set(indices))
+    if text_lower is None:
+        text_lower = text.lower()
+    return list(dict.fromkeys(
+        index_name
+        for domain_lower, index_lower, index_name in _index_terms()
+        if index_lower in text_lower or domain_lower in text_lower
+    ))
+
 
+def get_primary_files(text: str, mappings: Optional[List[Dict]] = None) -> List[str]:
+    """Get the most relevant files for a piece of text, deduplicated.
 
-def get_primary_files(text: str) -> List[str]:
-    """Get the most relevant files for a piece of text, deduplicated."""
-    mappings = map_keywords_to_files(text)
+    Pass mappings already returned by map_keywords_to_files(text) to avoid
+    scanning the text a second time.
+    """
+    if mappings is None:
+        mappings = map_keywords_to_files(text)
     seen = set()
     primary = []
     for m in mappings:
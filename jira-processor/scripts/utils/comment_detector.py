@@ -1,5 +1,6 @@
 """Utilities for detecting previous comments and follow-up scenarios."""
 
+import bisect
 from datetime import datetime
 from typing import Optional
 
@@ -36,11 +37,20 @@ def get_latest_user_comment(comments: list[dict], user_account_id: str) -> Optio
     Returns:
         The most recent comment by the user, or None if no comments found
     """
-    user_comments = find_user_comments(comments, user_account_id)
-    if not user_comments:
+    if not comments or not user_account_id:
         return None
 
-    return max(user_comments, key=lambda c: c.get("created", ""))
+    latest = None
+    latest_created = ""
+    for comment in comments:
+        if comment.get("author", {}).get("accountId") != user_account_id:
+            continue
+        created = comment.get("created", "")
+        if latest is None or created > latest_created:
+            latest = comment
+            latest_created = created
+
+    return latest
 
 
 def get_comments_after(
@@ -89,8 +99,50 @@ def has_followup_from_others(comments: list[dict], user_account_id: str) -> bool
         return False
 
     after_timestamp = latest_user_comment.get("created", "")
-    newer_comments = get_comments_after(comments, after_timestamp, exclude_account_id=user_account_id)
-    return len(newer_comments) > 0
+    if not after_timestamp:
+        return False
+
+    return any(
+        comment.get("created", "") > after_timestamp
+        and comment.get("author", {}).get("accountId") != user_account_id
+        for comment in comments
+    )
+
+
+class CommentIndex:
+    """Comments sorted by creation time, for answering many timestamp queries.
+
+    Build one per ticket when several cutoffs will be checked; each query
+    is then a binary search over the sorted timestamps instead of a scan.
+    """
+
+    def __init__(self, comments: list[dict]):
+        self.comments = sorted(comments or [], key=lambda c: c.get("created", ""))
+        self._created = [c.get("created", "") for c in self.comments]
+
+    def comments_after(
+        self,
+        after_timestamp: str,
+        exclude_account_id: Optional[str] = None
+    ) -> list[dict]:
+        """Same as get_comments_after(), returned in chronological order."""
+        if not after_timestamp:
+            return []
+
+        newer = self.comments[bisect.bisect_right(self._created, after_timestamp):]
+        if exclude_account_id:
+            newer = [c for c in newer if c.get("author", {}).get("accountId") != exclude_account_id]
+        return newer
+
+    def has_followup_from_others(self, user_account_id: str) -> bool:
+        """Same as has_followup_from_others() for the indexed comments."""
+        if not user_account_id:
+            return False
+
+        for created, comment in zip(reversed(self._created), reversed(self.comments)):
+            if comment.get("author", {}).get("accountId") == user_account_id:
+                return bool(created) and bool(self.comments_after(created, user_account_id))
+        return False
 
 
 def format_comments_for_followup(
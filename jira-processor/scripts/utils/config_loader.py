@@ -1,15 +1,12 @@
 """Load configuration dynamically from repo-level .claude/jira-config.yaml or .json"""
 
+import functools
 import os
 import json
+import pathlib
+import threading
 from typing import Dict, Optional
 
-try:
-    import yaml
-    HAS_YAML = True
-except ImportError:
-    HAS_YAML = False
-
 DEFAULT_CONFIG = {
     "jira": {
         "projects": [],
@@ -31,22 +28,50 @@ DEFAULT_CONFIG = {
 }
 
 
-def find_repo_root() -> Optional[str]:
-    """Find the git repository root from current working directory."""
-    cwd = os.getcwd()
-    while cwd != "/":
-        if os.path.isdir(os.path.join(cwd, ".git")):
-            return cwd
-        cwd = os.path.dirname(cwd)
+def find_repo_root(cwd: Optional[str] = None) -> Optional[str]:
+    """Find the git repository root from cwd (default: current working directory)."""
+    return _find_repo_root(os.path.abspath(cwd or os.getcwd()))
+
+
+@functools.lru_cache(maxsize=16)
+def _find_repo_root(cwd: str) -> Optional[str]:
+    """Walk up from an absolute cwd to the first directory containing .git."""
+    path = pathlib.Path(cwd).resolve()
+    for directory in (path, *path.parents):
+        if (directory / ".git").is_dir():
+            return str(directory)
     return None
 
 
-def load_repo_config() -> Dict:
+_CONFIG_CACHE: Dict[str, tuple] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+
+def _invalidate_config_cache() -> None:
+    """Drop all cached repo roots and configs (used by tests)."""
+    _find_repo_root.cache_clear()
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE.clear()
+
+
+def _get_mtime(path: str) -> Optional[float]:
+    """Return the file's mtime, or None if it does not exist."""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def load_repo_config(repo_root: Optional[str] = None) -> Dict:
     """
     Load configuration from repo-level .claude/jira-config.yaml or .json.
     Falls back to defaults if not found.
+
+    The parsed config is cached per repo root and re-read only when the
+    config file's mtime changes, so callers must treat it as read-only.
     """
-    repo_root = find_repo_root()
+    if repo_root is None:
+        repo_root = find_repo_root()
     if not repo_root:
         return DEFAULT_CONFIG.copy()
 
@@ -54,9 +79,34 @@ def load_repo_config() -> Dict:
     yaml_path = os.path.join(claude_dir, "jira-config.yaml")
     json_path = os.path.join(claude_dir, "jira-config.json")
 
+    stamp = (_get_mtime(yaml_path), _get_mtime(json_path))
+    with _CONFIG_CACHE_LOCK:
+        cached = _CONFIG_CACHE.get(repo_root)
+    if cached and cached[0] == stamp:
+        return cached[1]
+
+    merged = _read_repo_config(yaml_path, json_path)
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE[repo_root] = (stamp, merged)
+    return merged
+
+
+@functools.lru_cache(maxsize=None)
+def _get_yaml():
+    """Import PyYAML on first use; returns None if it is not installed."""
+    try:
+        import yaml
+    except ImportError:
+        return None
+    return yaml
+
+
+def _read_repo_config(yaml_path: str, json_path: str) -> Dict:
+    """Parse the repo config file and merge it over the defaults."""
     repo_config = {}
 
-    if os.path.exists(yaml_path) and HAS_YAML:
+    yaml = _get_yaml() if os.path.exists(yaml_path) else None
+    if yaml is not None:
         with open(yaml_path, "r") as f:
             repo_config = yaml.safe_load(f) or {}
     elif os.path.exists(json_path):
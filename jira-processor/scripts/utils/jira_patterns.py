@@ -1,58 +1,113 @@
 """Pattern matching utilities for Jira ticket classification."""
 
+import hashlib
 import re
-from typing import List, Dict
+from collections import OrderedDict
+from typing import List, Dict, Iterable, Iterator, NamedTuple, Optional, Sequence, Tuple
 
-CODE_CHANGE_KEYWORDS = [
+# Keyword lists are tuples: they're matched by substring (so "error" also
+# hits "errors") against the lowercased copies below, which are computed
+# once at import and must not drift from the originals.
+CODE_CHANGE_KEYWORDS = (
     "add", "implement", "create", "build", "develop",
     "fix", "bug", "error", "broken", "failing",
     "update", "modify", "change", "refactor",
     "remove", "delete", "deprecate",
     "configure", "enable", "disable",
     "integrate", "connect", "support"
-]
+)
 
-INVESTIGATION_KEYWORDS = [
+INVESTIGATION_KEYWORDS = (
     "not appearing", "not showing", "missing",
     "why", "investigate", "check", "look into",
     "cannot find", "doesn't exist", "no results",
     "no longer", "not working", "broken link"
-]
+)
 
-SKIP_KEYWORDS = [
+SKIP_KEYWORDS = (
     "meeting", "waiting for", "blocked by",
     "pending approval", "need access", "credentials required",
     "documentation only", "write docs", "update readme"
-]
+)
 
-TEST_KEYWORDS = [
+TEST_KEYWORDS = (
     "add test", "write test", "ensure tests pass", "tests should pass",
     "unit test", "integration test", "test coverage", "pytest",
     "test for", "verify with tests", "run tests"
-]
+)
 
-BUILD_KEYWORDS = [
+BUILD_KEYWORDS = (
     "fix build", "build failure", "lint error", "type error",
     "mypy", "pylint", "flake8", "ruff", "black", "isort",
     "compilation error", "syntax error", "import error"
-]
+)
 
-VAGUE_KEYWORDS = [
+VAGUE_KEYWORDS = (
     "improve", "enhance", "better", "optimize", "cleanup",
     "refactor where needed", "as needed", "if possible",
     "consider", "maybe", "perhaps", "could", "might want to"
-]
+)
 
-DESIGN_DECISION_KEYWORDS = [
+DESIGN_DECISION_KEYWORDS = (
     "decide how", "choose between", "evaluate options",
     "design", "architect", "propose", "research alternatives",
     "which approach", "what strategy", "determine the best"
-]
-
-ISBN_PATTERN = re.compile(r'\b(978\d{10})\b')
-FILE_PATTERN = re.compile(r'\b[\w/]+\.(py|yaml|json|xml)\b')
-FUNCTION_PATTERN = re.compile(r'\b(def\s+\w+|class\s+\w+|\w+\(\))\b')
+)
+
+# Leading literal lets the regex engine skip straight to "978" candidates;
+# the lookbehind restores the word boundary in front of it.
+ISBN_PATTERN = re.compile(r'978(?<!\w978)\d{10}\b')
+# File and code references are ASCII identifiers; re.ASCII keeps \w, \s and
+# \b off the Unicode tables, which roughly halves their scan time.
+FILE_PATTERN = re.compile(r'\b[\w/]+\.(py|yaml|json|xml)\b', re.ASCII)
+FILE_EXT_PATTERN = re.compile(r'\.(?:py|yaml|json|xml)\b', re.ASCII)
+FUNCTION_PATTERN = re.compile(r'\b(def\s+\w+|class\s+\w+|\w+\(\))\b', re.ASCII)
 URL_PATTERN = re.compile(r'https?://[^\s<>"]+')
+TEST_HINT_PATTERN = re.compile(r'test_|_test|tests|config/|lib/|src/')
+
+_SKIP_LOWER = tuple(kw.lower() for kw in SKIP_KEYWORDS)
+_INVESTIGATION_LOWER = tuple(kw.lower() for kw in INVESTIGATION_KEYWORDS)
+_CODE_CHANGE_LOWER = tuple(kw.lower() for kw in CODE_CHANGE_KEYWORDS)
+_TEST_LOWER = tuple(kw.lower() for kw in TEST_KEYWORDS)
+_BUILD_LOWER = tuple(kw.lower() for kw in BUILD_KEYWORDS)
+_VAGUE_LOWER = tuple(kw.lower() for kw in VAGUE_KEYWORDS)
+_DESIGN_DECISION_LOWER = tuple(kw.lower() for kw in DESIGN_DECISION_KEYWORDS)
+
+# Lets the public helpers skip lowercasing when handed a module keyword tuple
+_KEYWORDS_LOWER = {
+    id(keywords): lowered
+    for keywords, lowered in (
+        (SKIP_KEYWORDS, _SKIP_LOWER),
+        (INVESTIGATION_KEYWORDS, _INVESTIGATION_LOWER),
+        (CODE_CHANGE_KEYWORDS, _CODE_CHANGE_LOWER),
+        (TEST_KEYWORDS, _TEST_LOWER),
+        (BUILD_KEYWORDS, _BUILD_LOWER),
+        (VAGUE_KEYWORDS, _VAGUE_LOWER),
+        (DESIGN_DECISION_KEYWORDS, _DESIGN_DECISION_LOWER),
+    )
+}
+
+
+class Classification(NamedTuple):
+    """A classify_ticket_type() result, as held in the classification cache."""
+
+    type: str
+    confidence: float
+    reason: str
+    extracted_data: Dict[str, List[str]]
+
+    def to_dict(self) -> Dict:
+        """Return the result as a fresh dict that callers may modify."""
+        return {
+            "type": self.type,
+            "confidence": self.confidence,
+            "reason": self.reason,
+            "extracted_data": {name: list(values) for name, values in self.extracted_data.items()}
+        }
+
+
+_CLASSIFY_CACHE: "OrderedDict[bytes, Classification]" = OrderedDict()
+_CLASSIFY_CACHE_SIZE = 4096
 
 
 def extract_isbns(text: str) -> List[str]:
@@ -62,7 +117,12 @@ def extract_isbns(text: str) -> List[str]:
 
 def extract_file_references(text: str) -> List[str]:
     """Extract file path references from text."""
-    return FILE_PATTERN.findall(text)
+    # Every match ends in one of the extensions and cannot span lines, so the
+    # full pattern only needs to run from the line holding the first one.
+    first = FILE_EXT_PATTERN.search(text)
+    if not first:
+        return []
+    return FILE_PATTERN.findall(text, text.rfind("\n", 0, first.start()) + 1)
 
 
 def extract_urls(text: str) -> List[str]:
@@ -72,23 +132,68 @@ def extract_urls(text: str) -> List[str]:
 
 def extract_function_references(text: str) -> List[str]:
     """Extract function/class references from text."""
-    return FUNCTION_PATTERN.findall(text)
+    # Every match contains "def", "class" or "()", and a "name()" match
+    # cannot start before the line holding its "()", so the full pattern
+    # only needs to run from the earliest such anchor.
+    starts = [i for i in (text.find("def"), text.find("class")) if i >= 0]
+    call = text.find("()")
+    if call >= 0:
+        starts.append(text.rfind("\n", 0, call) + 1)
+    if not starts:
+        return []
+    return FUNCTION_PATTERN.findall(text, min(starts))
+
+
+def extract_all(text: str) -> Dict[str, List[str]]:
+    """Run every extractor over text, keyed as in classify_ticket_type()'s extracted_data."""
+    return {
+        "isbns": extract_isbns(text),
+        "urls": extract_urls(text),
+        "file_refs": extract_file_references(text),
+        "function_refs": extract_function_references(text)
+    }
+
+
+def _lowered_keywords(keywords: Sequence[str]) -> Sequence[str]:
+    """Return lowercased keywords, precomputed for the module keyword tuples."""
+    lowered = _KEYWORDS_LOWER.get(id(keywords))
+    if lowered is None:
+        lowered = [kw.lower() for kw in keywords]
+    return lowered
 
 
-def count_keyword_matches(text: str, keywords: List[str]) -> int:
+def count_keyword_matches(text: str, keywords: Sequence[str]) -> int:
     """Count how many keywords appear in text (case-insensitive)."""
     text_lower = text.lower()
-    count = 0
-    for keyword in keywords:
-        if keyword.lower() in text_lower:
-            count += 1
-    return count
+    return sum(1 for kw_lower in _lowered_keywords(keywords) if kw_lower in text_lower)
 
 
-def find_matching_keywords(text: str, keywords: List[str]) -> List[str]:
+def find_matching_keywords(text: str, keywords: Sequence[str]) -> List[str]:
     """Return list of keywords that appear in text."""
-    text_lower = text.lower()
-    return [kw for kw in keywords if kw.lower() in text_lower]
+    return _find_lowered(text.lower(), _lowered_keywords(keywords), keywords)
+
+
+def any_matching_keyword(text: str, keywords: Sequence[str]) -> bool:
+    """Return True if any keyword appears in text, stopping at the first hit."""
+    return _any_lowered(text.lower(), _lowered_keywords(keywords))
+
+
+def _any_lowered(text_lower: str, keywords_lower: Sequence[str]) -> bool:
+    """Return True if any pre-lowercased keyword appears in lowercased text."""
+    return any(kw_lower in text_lower for kw_lower in keywords_lower)
+
+
+def _find_lowered(text_lower: str, keywords_lower: Sequence[str], keywords: Sequence[str]) -> List[str]:
+    """Return keywords whose pre-lowercased form appears in lowercased text."""
+    return [kw for kw, kw_lower in zip(keywords, keywords_lower) if kw_lower in text_lower]
+
+
+def build_full_text(summary: str, description: str, comments: str = "") -> str:
+    """Join ticket fields into the single text the classifiers scan."""
+    full_text = f"{summary}\n{description}"
+    if comments:
+        full_text = f"{full_text}\n{comments}"
+    return full_text
 
 
 def classify_ticket_type(summary: str, description: str, comments: str = "") -> Dict:
@@ -105,80 +210,106 @@ def classify_ticket_type(summary: str, description: str, comments: str = "") ->
         - confidence: float (0.0 to 1.0)
         - reason: str
         - extracted_data: dict with ISBNs, URLs, file refs, etc.
+          (empty for tickets skipped on a skip indicator)
     """
-    full_text = f"{summary}\n{description}"
-    if comments:
-        full_text = f"{full_text}\n{comments}"
+    return classify_ticket_type_from_text(build_full_text(summary, description, comments))
 
-    extracted_data = {
-        "isbns": extract_isbns(full_text),
-        "urls": extract_urls(full_text),
-        "file_refs": extract_file_references(full_text),
-        "function_refs": extract_function_references(full_text)
-    }
 
-    skip_matches = find_matching_keywords(full_text, SKIP_KEYWORDS)
+def classify_ticket_type_from_text(full_text: str, text_lower: Optional[str] = None) -> Dict:
+    """Classify text already joined by build_full_text().
+
+    Same result as classify_ticket_type(); lets callers that have built the
+    full text (and optionally its lowercased form) reuse it instead of
+    joining and lowercasing the fields again. Results are cached by a
+    digest of full_text, so re-classifying an unchanged ticket is a lookup.
+    """
+    key = hashlib.blake2b(full_text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    result = _CLASSIFY_CACHE.get(key)
+    if result is not None:
+        _CLASSIFY_CACHE.move_to_end(key)
+    else:
+        if text_lower is None:
+            text_lower = full_text.lower()
+        result = _classify_text(full_text, text_lower)
+        _CLASSIFY_CACHE[key] = result
+        if len(_CLASSIFY_CACHE) > _CLASSIFY_CACHE_SIZE:
+            _CLASSIFY_CACHE.popitem(last=False)
+
+    # Callers add keys to the result, so hand out a copy rather than the cached entry.
+    return result.to_dict()
+
+
+def _classify_text(full_text: str, text_lower: str) -> Classification:
+    """Score text against the keyword lists and extractors (uncached)."""
+    skip_matches = _find_lowered(text_lower, _SKIP_LOWER, SKIP_KEYWORDS)
     if skip_matches:
-        return {
-            "type": "SKIP",
-            "confidence": 0.9,
-            "reason": f"Contains skip indicators: {', '.join(skip_matches)}",
-            "extracted_data": extracted_data
-        }
+        return Classification(
+            type="SKIP",
+            confidence=0.9,
+            reason=f"Contains skip indicators: {', '.join(skip_matches)}",
+            extracted_data={}
+        )
 
-    investigation_matches = find_matching_keywords(full_text, INVESTIGATION_KEYWORDS)
-    code_change_matches = find_matching_keywords(full_text, CODE_CHANGE_KEYWORDS)
+    extracted_data = extract_all(full_text)
 
-    has_urls = len(extracted_data["urls"]) > 0
-    has_file_refs = len(extracted_data["file_refs"]) > 0
+    investigation_matches = _find_lowered(text_lower, _INVESTIGATION_LOWER, INVESTIGATION_KEYWORDS)
+    code_change_matches = _find_lowered(text_lower, _CODE_CHANGE_LOWER, CODE_CHANGE_KEYWORDS)
 
     investigation_score = len(investigation_matches) * 2
-    if has_urls:
+    if extracted_data["urls"]:
         investigation_score += 2
 
     code_change_score = len(code_change_matches) * 2
-    if has_file_refs:
+    if extracted_data["file_refs"]:
         code_change_score += 3
     if extracted_data["function_refs"]:
         code_change_score += 2
 
     if investigation_score > code_change_score and investigation_score >= 3:
-        return {
-            "type": "INVESTIGATION",
-            "confidence": min(investigation_score / 10, 1.0),
-            "reason": f"Investigation indicators: {', '.join(investigation_matches)}",
-            "extracted_data": extracted_data
-        }
+        return Classification(
+            type="INVESTIGATION",
+            confidence=min(investigation_score / 10, 1.0),
+            reason=f"Investigation indicators: {', '.join(investigation_matches)}",
+            extracted_data=extracted_data
+        )
 
     if code_change_score >= 2:
-        return {
-            "type": "CODE_CHANGE",
-            "confidence": min(code_change_score / 10, 1.0),
-            "reason": f"Code change indicators: {', '.join(code_change_matches)}",
-            "extracted_data": extracted_data
-        }
+        return Classification(
+            type="CODE_CHANGE",
+            confidence=min(code_change_score / 10, 1.0),
+            reason=f"Code change indicators: {', '.join(code_change_matches)}",
+            extracted_data=extracted_data
+        )
+
+    return Classification(
+        type="SKIP",
+        confidence=0.5,
+        reason="No clear action indicators found",
+        extracted_data=extracted_data
+    )
+
+
+def classify_tickets_batch(items: Iterable[Tuple[str, str, str]]) -> Iterator[Dict]:
+    """
+    Classify many tickets lazily.
 
-    return {
-        "type": "SKIP",
-        "confidence": 0.5,
-        "reason": "No clear action indicators found",
-        "extracted_data": extracted_data
-    }
+    Args:
+        items: Iterable of (summary, description, comments) tuples
+
+    Yields:
+        One classify_ticket_type() result per item, in input order
+    """
+    classify = classify_ticket_type
+    for summary, description, comments in items:
+        yield classify(summary, description, comments)
 
 
 def has_test_file_for_refs(file_refs: List[str]) -> bool:
     """Check if file references likely have corresponding test files."""
-    for ref in file_refs:
-        if ref.endswith('.py'):
-            base_name = ref.replace('.py', '')
-            if any(pattern in base_name for pattern in ['test_', '_test', 'tests']):
-                return True
-            if 'config/' in ref or 'lib/' in ref or 'src/' in ref:
-                return True
-    return False
+    return any(ref.endswith('.py') and TEST_HINT_PATTERN.search(ref) for ref in file_refs)
 
 
-def assess_ralph_eligibility(ticket_data: Dict, classification: Dict) -> Dict:
+def assess_ralph_eligibility(ticket_data: Dict, classification: Dict, text_lower: Optional[str] = None) -> Dict:
     """
     Assess whether a CODE_CHANGE ticket is Ralph-eligible.
 
@@ -188,6 +319,8 @@ def assess_ralph_eligibility(ticket_data: Dict, classification: Dict) -> Dict:
     Args:
         ticket_data: Dict with 'summary' and 'description' keys
         classification: Result from classify_ticket_type()
+        text_lower: Lowercased build_full_text() of the ticket, if the caller
+            already has it; otherwise built from ticket_data
 
     Returns:
         Dict with:
@@ -206,9 +339,12 @@ def assess_ralph_eligibility(ticket_data: Dict, classification: Dict) -> Dict:
             "reason": "Not a CODE_CHANGE ticket"
         }
 
-    full_text = f"{ticket_data.get('summary', '')}\n{ticket_data.get('description', '')}"
-    if ticket_data.get('comments'):
-        full_text = f"{full_text}\n{ticket_data.get('comments', '')}"
+    if text_lower is None:
+        text_lower = build_full_text(
+            ticket_data.get('summary', ''),
+            ticket_data.get('description', ''),
+            ticket_data.get('comments', '')
+        ).lower()
     extracted_data = classification.get("extracted_data", {})
     file_refs = extracted_data.get("file_refs", [])
 
@@ -220,13 +356,11 @@ def assess_ralph_eligibility(ticket_data: Dict, classification: Dict) -> Dict:
         score += 3
         criteria_met.append("existing_tests")
 
-    test_matches = find_matching_keywords(full_text, TEST_KEYWORDS)
-    if test_matches:
+    if _any_lowered(text_lower, _TEST_LOWER):
         score += 2
         criteria_met.append("test_requirements")
 
-    build_matches = find_matching_keywords(full_text, BUILD_KEYWORDS)
-    if build_matches:
+    if _any_lowered(text_lower, _BUILD_LOWER):
         score += 2
         criteria_met.append("build_criteria")
 
@@ -238,13 +372,11 @@ def assess_ralph_eligibility(ticket_data: Dict, classification: Dict) -> Dict:
         score += 1
         criteria_met.append("specific_functions")
 
-    vague_matches = find_matching_keywords(full_text, VAGUE_KEYWORDS)
-    if vague_matches:
+    if _any_lowered(text_lower, _VAGUE_LOWER):
         score -= 2
         disqualifiers.append("vague_requirements")
 
-    design_matches = find_matching_keywords(full_text, DESIGN_DECISION_KEYWORDS)
-    if design_matches:
+    if _any_lowered(text_lower, _DESIGN_DECISION_LOWER):
         score -= 3
         disqualifiers.append("requires_design_decisions")
 
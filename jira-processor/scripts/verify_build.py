@@ -10,50 +10,223 @@ Usage:
 """
 
 import argparse
+import concurrent.futures
 import json
 import subprocess
 import sys
 import os
-from typing import Dict, List, Tuple
+import re
+import shlex
+import signal
+import tempfile
+import threading
+from collections import deque
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from utils.config_loader import get_verification_config, find_repo_root
 
+OUTPUT_SUMMARY_CHARS = 2000
+# Output beyond this many characters is spooled to a temp file for parsing
+OUTPUT_SPOOL_CHARS = 1 << 20
+
+# Commands using any of these need /bin/sh to interpret them
+SHELL_SYNTAX_PATTERN = re.compile(r'[|&;<>()$`*?\[\]{}~!#\n]|^\s*\w+=')
+
 
 def get_project_root() -> str:
     """Get project root directory."""
     return find_repo_root() or os.getcwd()
 
 
-def run_command(command: str, timeout: int = 300) -> Tuple[int, str, str]:
-    """Run a shell command and return exit code, stdout, stderr."""
+def split_command(command: str) -> Tuple[Union[str, List[str]], bool]:
+    """Return (args, use_shell) for a configured command.
+
+    Plain commands are split with shlex and run without a shell; anything
+    using pipes, redirects, variables, globs or other shell syntax is left
+    as a string for /bin/sh.
+    """
+    if SHELL_SYNTAX_PATTERN.search(command):
+        return command, True
     try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
+        return shlex.split(command), False
+    except ValueError:
+        return command, True
+
+
+def _kill_process_group(process: subprocess.Popen) -> None:
+    """Kill a command started by run_command along with its children.
+
+    Commands run in their own session, so signals sent to ours (Ctrl-C)
+    don't reach them; killing the group also stops children holding the pipe.
+    """
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except OSError:
+        process.kill()
+
+
+class CommandGroup:
+    """Commands started for one verification run, so they can be cancelled together.
+
+    Once cancelled, running commands are killed and any command that
+    starts afterwards is killed as soon as it registers.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._processes = set()
+        self._cancelled = False
+
+    def add(self, process: subprocess.Popen) -> None:
+        with self._lock:
+            self._processes.add(process)
+            if self._cancelled:
+                _kill_process_group(process)
+
+    def discard(self, process: subprocess.Popen) -> None:
+        with self._lock:
+            self._processes.discard(process)
+
+    def cancel(self) -> None:
+        with self._lock:
+            self._cancelled = True
+            for process in self._processes:
+                _kill_process_group(process)
+
+
+def run_command(
+    command: str,
+    timeout: int = 300,
+    parse_lines: Optional[Callable[[Iterable[str]], List[Dict]]] = None,
+    group: Optional[CommandGroup] = None
+) -> Tuple[int, str, List[Dict]]:
+    """Run a configured command, streaming its combined stdout/stderr.
+
+    The full output is spooled to a temp file once it passes
+    OUTPUT_SPOOL_CHARS, keeping only the last OUTPUT_SUMMARY_CHARS
+    characters in memory; parse_lines reads it back only if the command
+    fails.
+
+    If group is given the command is registered with it, so
+    group.cancel() kills it.
+
+    Returns exit code, output tail, and the result of parse_lines
+    (empty when the command succeeds).
+    """
+    tail = deque()
+    parsed = []
+    args, use_shell = split_command(command)
+    try:
+        process = subprocess.Popen(
+            args,
+            shell=use_shell,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=timeout,
-            cwd=get_project_root()
+            errors="replace",
+            bufsize=1,
+            cwd=get_project_root(),
+            start_new_session=True
         )
-        return result.returncode, result.stdout, result.stderr
-    except subprocess.TimeoutExpired:
-        return -1, "", f"Command timed out after {timeout} seconds"
     except Exception as e:
-        return -1, "", str(e)
+        return -1, str(e), parsed
+
+    if group is not None:
+        group.add(process)
+
+    timed_out = threading.Event()
+
+    def on_timeout():
+        timed_out.set()
+        _kill_process_group(process)
+
+    exit_code = None
+    error = None
+    timer = threading.Timer(timeout, on_timeout)
+    timer.start()
+    spool = tempfile.SpooledTemporaryFile(
+        max_size=OUTPUT_SPOOL_CHARS, mode="w+", encoding="utf-8", newline=""
+    )
+    try:
+        # write() per line, not writelines(): only write() checks for rollover
+        for line in _collect_tail(process.stdout, tail):
+            spool.write(line)
+        exit_code = process.wait()
+        if timed_out.is_set():
+            exit_code = -1
+        if exit_code != 0 and parse_lines:
+            spool.seek(0)
+            parsed = parse_lines(_strip_lines(spool))
+    except Exception as e:
+        error = str(e)
+    finally:
+        timer.cancel()
+        # Also reached on KeyboardInterrupt, which then propagates
+        if process.returncode is None:
+            _kill_process_group(process)
+            process.wait()
+        if group is not None:
+            group.discard(process)
+        process.stdout.close()
+        spool.close()
+
+    if error is not None:
+        return -1, error, parsed
+
+    output = "".join(tail)[-OUTPUT_SUMMARY_CHARS:]
+    if timed_out.is_set():
+        if output and not output.endswith("\n"):
+            output += "\n"
+        return -1, output + f"Command timed out after {timeout} seconds", parsed
+    return exit_code, output, parsed
+
+
+def _collect_tail(stream: Iterable[str], tail: deque) -> Iterator[str]:
+    """Yield lines from stream, keeping the last OUTPUT_SUMMARY_CHARS in tail."""
+    size = 0
+    for line in stream:
+        tail.append(line)
+        size += len(line)
+        while size - len(tail[0]) >= OUTPUT_SUMMARY_CHARS:
+            size -= len(tail.popleft())
+        yield line
+
+
+def _strip_lines(stream: Iterable[str]) -> Iterator[str]:
+    """Yield lines from stream without their trailing newline."""
+    for line in stream:
+        yield line.rstrip("\n")
+
+
+def _iter_lines(output: str) -> Iterator[str]:
+    """Yield lines of output one at a time, without building a list or a copy."""
+    start = 0
+    find = output.find
+    while True:
+        end = find("\n", start)
+        if end < 0:
+            yield output[start:]
+            return
+        yield output[start:end]
+        start = end + 1
 
 
 def parse_pytest_failures(output: str) -> List[Dict]:
     """Parse pytest output to extract failure details."""
+    return _parse_pytest_lines(_iter_lines(output))
+
+
+def _parse_pytest_lines(lines: Iterable[str]) -> List[Dict]:
+    """Extract failure details from pytest output lines."""
     failures = []
-    lines = output.split("\n")
     current_failure = None
 
     for line in lines:
         if line.startswith("FAILED "):
             if current_failure:
                 failures.append(current_failure)
-            test_path = line.replace("FAILED ", "").split(" ")[0]
+            test_path = line[7:].partition(" ")[0]
             current_failure = {
                 "test": test_path,
                 "error": "",
@@ -70,11 +243,15 @@ def parse_pytest_failures(output: str) -> List[Dict]:
 
 def parse_build_errors(output: str) -> List[Dict]:
     """Parse build output to extract errors."""
+    return _parse_build_lines(_iter_lines(output))
+
+
+def _parse_build_lines(lines: Iterable[str]) -> List[Dict]:
+    """Extract errors from build output lines."""
     errors = []
-    lines = output.split("\n")
 
     for i, line in enumerate(lines):
-        if "error" in line.lower() or "Error:" in line:
+        if "error" in line.lower():
             errors.append({
                 "line": i + 1,
                 "message": line.strip(),
@@ -84,46 +261,40 @@ def parse_build_errors(output: str) -> List[Dict]:
     return errors
 
 
-def run_tests() -> Dict:
+def run_tests(group: Optional[CommandGroup] = None) -> Dict:
     """Run tests and return results."""
     config = get_verification_config()
     command = config.get("test_command", "python -m pytest -v --tb=short")
     timeout = config.get("timeout_seconds", 300)
 
-    exit_code, stdout, stderr = run_command(command, timeout)
-
-    output = stdout + stderr
-    failures = parse_pytest_failures(output) if exit_code != 0 else []
+    exit_code, output, failures = run_command(command, timeout, _parse_pytest_lines, group)
 
     return {
         "passed": exit_code == 0,
         "exit_code": exit_code,
         "failures": failures,
-        "output_summary": output[-2000:] if len(output) > 2000 else output
+        "output_summary": output
     }
 
 
-def run_build() -> Dict:
+def run_build(group: Optional[CommandGroup] = None) -> Dict:
     """Run build and return results."""
     config = get_verification_config()
     command = config.get("build_command", "docker-compose build")
     timeout = config.get("timeout_seconds", 300)
 
-    exit_code, stdout, stderr = run_command(command, timeout)
-
-    output = stdout + stderr
-    errors = parse_build_errors(output) if exit_code != 0 else []
+    exit_code, output, errors = run_command(command, timeout, _parse_build_lines, group)
 
     return {
         "passed": exit_code == 0,
         "exit_code": exit_code,
         "errors": errors,
-        "output_summary": output[-2000:] if len(output) > 2000 else output
+        "output_summary": output
     }
 
 
 def verify_all() -> Dict:
-    """Run both tests and build verification."""
+    """Run tests and build verification concurrently."""
     result = {
         "success": True,
         "tests_passed": None,
@@ -132,7 +303,21 @@ def verify_all() -> Dict:
         "error_messages": []
     }
 
-    test_result = run_tests()
+    group = CommandGroup()
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+    try:
+        test_future = executor.submit(run_tests, group)
+        build_future = executor.submit(run_build, group)
+        test_result = test_future.result()
+        build_result = build_future.result()
+    except BaseException:
+        # On Ctrl-C (or if either side raises), stop this run's commands
+        # instead of waiting for them to finish
+        group.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
+
     result["tests_passed"] = test_result["passed"]
     if not test_result["passed"]:
         result["success"] = False
@@ -141,7 +326,6 @@ def verify_all() -> Dict:
             if f.get("error"):
                 result["error_messages"].append(f"Test failure in {f['test']}: {f['error'][:500]}")
 
-    build_result = run_build()
     result["build_passed"] = build_result["passed"]
     if not build_result["passed"]:
         result["success"] = False